@@ -10,6 +10,7 @@ __version__ = "0.1.5"
 from durable_monty.models import init_db, Execution, Call, ExecutionStatus, CallStatus
 from durable_monty.service import OrchestratorService
 from durable_monty.worker import Worker
+from durable_monty.async_worker import AsyncWorker
 from durable_monty.executor import Executor, LocalExecutor
 
 __all__ = [
@@ -21,6 +22,7 @@ __all__ = [
     "CallStatus",
     "OrchestratorService",
     "Worker",
+    "AsyncWorker",
     "Executor",
     "LocalExecutor",
 ]
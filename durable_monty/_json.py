@@ -0,0 +1,22 @@
+"""JSON codec selection - orjson (C extension) when available, stdlib otherwise.
+
+The selected pair runs on every Call/Execution read and write (it is
+installed as the engine's json_serializer/json_deserializer), so the
+faster codec is a direct throughput win on the poll and webhook paths.
+Install with the `orjson` extra to get the fast path.
+"""
+
+from typing import Any
+
+try:
+    import orjson
+
+    def dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    loads = orjson.loads
+except ImportError:
+    import json
+
+    dumps = json.dumps
+    loads = json.loads
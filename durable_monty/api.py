@@ -2,12 +2,13 @@
 
 import logging
 from typing import Any
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException
 from pydantic import BaseModel
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from durable_monty.service import OrchestratorService
-from durable_monty.models import Call
+from durable_monty.models import Call, CallStatus
 
 logger = logging.getLogger(__name__)
 
@@ -20,45 +21,66 @@ class JobResult(BaseModel):
     error: str | None = None
 
 
-def create_app(service: OrchestratorService) -> FastAPI:
-    """Create FastAPI app with webhook endpoints."""
+def create_app(service: OrchestratorService, executor=None) -> FastAPI:
+    """
+    Create FastAPI app with webhook endpoints.
+
+    Args:
+        service: Orchestrator service backing the endpoints
+        executor: Optional executor. If it exposes `lookup_job` (like
+            RQExecutor), the webhook resolves job ids from the executor's
+            own store instead of querying the database.
+    """
     app = FastAPI(title="Durable Monty", description="Durable functions orchestrator")
+    lookup_job = getattr(executor, "lookup_job", None)
+
+    def get_session():
+        """Yield a session from the service's shared sessionmaker."""
+        with service.Session() as session:
+            yield session
 
     @app.post("/webhook/complete")
-    async def webhook_complete(payload: JobResult):
+    def webhook_complete(payload: JobResult, session: Session = Depends(get_session)):
         """
         Webhook endpoint for executors to report job completion.
 
         Used by event-driven executors (Lambda, Modal, etc) to push results
         instead of being polled by the worker.
+
+        Declared sync so Starlette runs it in the threadpool - the
+        blocking SQLAlchemy work must not stall the event loop.
         """
         try:
             logger.info(f"Webhook received for job {payload.job_id[:8]}: {payload.status}")
 
-            # Find the call by job_id
-            with Session(service.engine) as session:
-                call = session.query(Call).filter_by(job_id=payload.job_id).first()
-
-                if not call:
+            # Resolve the job: executor-side mapping first (sub-ms Redis GET
+            # for RQ), database lookup as fallback
+            mapping = lookup_job(payload.job_id) if lookup_job else None
+            if mapping:
+                execution_id, call_id = mapping
+            else:
+                row = session.execute(
+                    select(Call.execution_id, Call.call_id).where(Call.job_id == payload.job_id)
+                ).first()
+                if not row:
                     raise HTTPException(status_code=404, detail=f"Job {payload.job_id} not found")
+                execution_id, call_id = row.execution_id, row.call_id
 
-                if payload.status == "finished":
-                    # Complete the call
-                    service.complete_call(
-                        call.execution_id,
-                        call.call_id,
-                        payload.result
-                    )
-                    logger.info(f"Completed call {call.call_id} for execution {call.execution_id[:8]}")
+            if payload.status == "finished":
+                # Complete the call
+                service.complete_call(execution_id, call_id, payload.result)
+                logger.info(f"Completed call {call_id} for execution {execution_id[:8]}")
 
-                elif payload.status == "failed":
-                    # Mark as failed
-                    call.status = "failed"
-                    call.error = payload.error or "Unknown error"
-                    session.commit()
-                    logger.error(f"Job {payload.job_id[:8]} failed: {call.error}")
+            elif payload.status == "failed":
+                # Mark as failed
+                error = payload.error or "Unknown error"
+                session.query(Call).filter_by(
+                    execution_id=execution_id, call_id=call_id
+                ).update({"status": CallStatus.FAILED, "error": error})
+                session.commit()
+                logger.error(f"Job {payload.job_id[:8]} failed: {error}")
 
-                return {"status": "ok", "execution_id": call.execution_id, "call_id": call.call_id}
+            return {"status": "ok", "execution_id": execution_id, "call_id": call_id}
 
         except HTTPException:
             raise
@@ -67,7 +89,7 @@ def create_app(service: OrchestratorService) -> FastAPI:
             raise HTTPException(status_code=500, detail=str(e))
 
     @app.get("/executions/{execution_id}")
-    async def get_execution(execution_id: str):
+    def get_execution(execution_id: str):
         """Get execution status."""
         result = service.poll(execution_id)
         if not result:
@@ -75,7 +97,7 @@ def create_app(service: OrchestratorService) -> FastAPI:
         return result
 
     @app.get("/executions")
-    async def list_executions():
+    def list_executions():
         """List all executions."""
         return service.poll()
 
@@ -1,9 +1,13 @@
 """Execution engine abstraction for running external function calls."""
 
 import logging
-import uuid
+import queue
+import secrets
+import threading
 from abc import ABC, abstractmethod
-from typing import Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
 
 from durable_monty.functions import execute_function
 
@@ -13,8 +17,21 @@ logger = logging.getLogger(__name__)
 class Executor(ABC):
     """Abstract base class for execution engines."""
 
+    # Executors that learn about completions directly (in-process
+    # execution, webhook receivers) push (execution_id, call_id, result)
+    # here; workers drain it each tick and only fall back to polling job
+    # status for what the queue didn't deliver. None = push not supported.
+    completion_queue: "queue.Queue[tuple[str, int, Any]] | None" = None
+
     @abstractmethod
-    def submit_call(self, function_name: str, args: list, kwargs: dict | None = None) -> str:
+    def submit_call(
+        self,
+        function_name: str,
+        args: list,
+        kwargs: dict | None = None,
+        execution_id: str | None = None,
+        call_id: int | None = None,
+    ) -> str:
         """
         Submit a call for execution.
 
@@ -22,6 +39,9 @@ class Executor(ABC):
             function_name: Full path to the function
             args: Positional arguments
             kwargs: Keyword arguments
+            execution_id: Owning execution (lets executors map job ids back
+                to calls without a database lookup)
+            call_id: Monty call id within the execution
 
         Returns:
             job_id that can be used to check status later
@@ -38,6 +58,18 @@ class Executor(ABC):
         """
         pass
 
+    def check_jobs(self, job_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        Check status of many jobs at once.
+
+        Default implementation loops over check_job; executors backed by a
+        remote store should override this with a single batched round-trip.
+
+        Returns:
+            {job_id: {"status": ..., "result": ..., "error": ...}}
+        """
+        return {job_id: self.check_job(job_id) for job_id in job_ids}
+
     @abstractmethod
     def get_stats(self) -> dict[str, Any]:
         """Get executor statistics."""
@@ -47,35 +79,103 @@ class Executor(ABC):
 class LocalExecutor(Executor):
     """Executes functions locally in the same process."""
 
-    def __init__(self):
-        self.results = {}  # job_id -> result
+    def __init__(self, max_results: int = 100_000, max_workers: int | None = None):
+        """
+        Args:
+            max_results: Maximum completed results kept in memory. Oldest
+                results are evicted first, so long-running processes don't
+                accumulate history without bound.
+            max_workers: When set, calls run on a thread pool of this size
+                and submit_call returns immediately, so a gather fan-out of
+                I/O-bound functions overlaps instead of running serially
+                inside the worker tick. Default (None) keeps the original
+                synchronous execute-on-submit behavior.
+        """
+        self.results = OrderedDict()  # job_id -> result (insertion-ordered)
+        self.max_results = max_results
         self.stats = {"executed": 0, "failed": 0}
+        self.completion_queue = queue.Queue()
+        self._listeners: list[Callable[[], None]] = []
+        self._pool = (
+            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="local-exec")
+            if max_workers
+            else None
+        )
+        # Pool threads and the worker thread both touch results/stats
+        self._lock = threading.Lock()
+
+    def add_listener(self, callback: Callable[[], None]) -> None:
+        """Register a callback fired after a completion is pushed."""
+        self._listeners.append(callback)
+
+    def _trim(self) -> None:
+        """Evict oldest results beyond max_results (caller holds the lock)."""
+        while len(self.results) > self.max_results:
+            self.results.popitem(last=False)
+
+    def submit_call(
+        self,
+        function_name: str,
+        args: list,
+        kwargs: dict | None = None,
+        execution_id: str | None = None,
+        call_id: int | None = None,
+    ) -> str:
+        """Execute the function (immediately, or on the pool) and store the result."""
+        job_id = secrets.token_hex(16)
+
+        if self._pool is not None:
+            with self._lock:
+                self.results[job_id] = {"status": "started"}
+            self._pool.submit(
+                self._execute, job_id, function_name, args, kwargs, execution_id, call_id
+            )
+        else:
+            self._execute(job_id, function_name, args, kwargs, execution_id, call_id)
+        return job_id
 
-    def submit_call(self, function_name: str, args: list, kwargs: dict | None = None) -> str:
-        """Execute function immediately and store result."""
-        job_id = str(uuid.uuid4())
-
+    def _execute(
+        self,
+        job_id: str,
+        function_name: str,
+        args: list,
+        kwargs: dict | None,
+        execution_id: str | None,
+        call_id: int | None,
+    ) -> None:
+        """Run one call and record its outcome (any thread)."""
         try:
             kwargs_str = f", {kwargs}" if kwargs else ""
             logger.info(f"Executing {function_name}{tuple(args)}{kwargs_str}")
             result = execute_function(function_name, args, kwargs)
 
-            self.results[job_id] = {"status": "finished", "result": result}
+            with self._lock:
+                self.results[job_id] = {"status": "finished", "result": result}
+                self.stats["executed"] += 1
+                self._trim()
             logger.info(f"Completed {function_name}{tuple(args)}{kwargs_str} = {result}")
-            self.stats["executed"] += 1
+            if execution_id is not None and call_id is not None:
+                # Push the completion so the worker skips a status poll
+                self.completion_queue.put((execution_id, call_id, result))
+                for listener in self._listeners:
+                    try:
+                        listener()
+                    except Exception:  # noqa: BLE001 - listeners must not break execution
+                        pass
 
         except Exception as e:
             logger.error(f"Failed {function_name}: {e}")
-            self.results[job_id] = {"status": "failed", "error": str(e)}
-            self.stats["failed"] += 1
-
-        return job_id
+            with self._lock:
+                self.results[job_id] = {"status": "failed", "error": str(e)}
+                self.stats["failed"] += 1
+                self._trim()
 
     def check_job(self, job_id: str) -> dict[str, Any]:
         """Get result for a job."""
         return self.results.get(job_id, {"status": "error", "error": "Job not found"})
 
     def get_stats(self) -> dict[str, Any]:
-        return self.stats.copy()
+        with self._lock:
+            return self.stats.copy()
 
 
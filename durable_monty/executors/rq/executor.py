@@ -1,7 +1,8 @@
 """RQ executor for distributed task execution."""
 
 import logging
-from typing import Any
+import threading
+from typing import Any, Callable
 
 from durable_monty.executor import Executor
 
@@ -11,6 +12,13 @@ logger = logging.getLogger(__name__)
 class RQExecutor(Executor):
     """Executes functions using Redis Queue (RQ)."""
 
+    # How long the job -> (execution_id, call_id) mapping lives in Redis
+    JOB_MAPPING_TTL = 86400
+
+    # Pub/sub channel RQ workers publish to when a job finishes (see
+    # executors.rq.worker._notify_completion)
+    NOTIFY_CHANNEL = "dm:notify"
+
     def __init__(self, redis_conn=None, queue_name: str = "durable-monty"):
         """
         Initialize RQ executor.
@@ -30,9 +38,46 @@ class RQExecutor(Executor):
 
         self.redis_conn = redis_conn or Redis()
         self.queue = Queue(queue_name, connection=self.redis_conn)
+        self._listeners: list[Callable[[], None]] = []
+        self._listener_thread: threading.Thread | None = None
         logger.info(f"RQ executor initialized with queue '{queue_name}'")
 
-    def submit_call(self, function_name: str, args: list, kwargs: dict | None = None) -> str:
+    def add_listener(self, callback: Callable[[], None]) -> None:
+        """
+        Register a callback invoked when an RQ worker reports a finished job.
+
+        RQ workers publish on NOTIFY_CHANNEL after every job; a daemon
+        thread subscribed here fans the signal out, so orchestrator
+        workers wake with sub-millisecond latency instead of waiting out
+        their poll interval. Polling stays as the fallback when pub/sub
+        messages are lost.
+        """
+        self._listeners.append(callback)
+        if self._listener_thread is None:
+            self._listener_thread = threading.Thread(
+                target=self._listen, name="rq-executor-notify", daemon=True
+            )
+            self._listener_thread.start()
+
+    def _listen(self) -> None:
+        """Block on the pub/sub channel and fan messages out to listeners."""
+        pubsub = self.redis_conn.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(self.NOTIFY_CHANNEL)
+        for _ in pubsub.listen():
+            for callback in self._listeners:
+                try:
+                    callback()
+                except Exception:  # noqa: BLE001 - listeners must not kill the thread
+                    pass
+
+    def submit_call(
+        self,
+        function_name: str,
+        args: list,
+        kwargs: dict | None = None,
+        execution_id: str | None = None,
+        call_id: int | None = None,
+    ) -> str:
         """Submit call to RQ and return job_id."""
         from durable_monty.executors.rq.worker import execute_call_task
 
@@ -42,10 +87,30 @@ class RQExecutor(Executor):
             job_timeout="10m",
         )
 
+        if execution_id is not None and call_id is not None:
+            # Store the job -> call mapping in Redis so the webhook can
+            # resolve completions with a sub-ms GET instead of a DB lookup
+            self.redis_conn.set(
+                f"dm:job:{job.id}", f"{execution_id}:{call_id}", ex=self.JOB_MAPPING_TTL
+            )
+
         logger.info(f"Enqueued {function_name} to RQ [job={job.id[:8]}]")
 
         return job.id
 
+    def lookup_job(self, job_id: str) -> tuple[str, int] | None:
+        """
+        Resolve a job_id to (execution_id, call_id) from the Redis mapping.
+
+        Returns None when the mapping has expired or was never stored, in
+        which case callers should fall back to the database.
+        """
+        value = self.redis_conn.get(f"dm:job:{job_id}")
+        if not value:
+            return None
+        execution_id, _, call_id = value.decode().rpartition(":")
+        return execution_id, int(call_id)
+
     def check_job(self, job_id: str) -> dict[str, Any]:
         """
         Check status of an RQ job.
@@ -71,6 +136,35 @@ class RQExecutor(Executor):
             logger.error(f"Failed to fetch job {job_id}: {e}")
             return {"status": "error", "error": str(e)}
 
+    def check_jobs(self, job_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        Check many RQ jobs in one pipelined round-trip.
+
+        Uses Job.fetch_many, which fetches all hashes in a single Redis
+        pipeline instead of one round-trip per job.
+        """
+        from rq.job import Job
+
+        statuses: dict[str, dict[str, Any]] = {}
+        try:
+            jobs = Job.fetch_many(job_ids, connection=self.redis_conn)
+        except Exception as e:
+            logger.error(f"Failed to fetch jobs: {e}")
+            return {job_id: {"status": "error", "error": str(e)} for job_id in job_ids}
+
+        for job_id, job in zip(job_ids, jobs):
+            if job is None:
+                statuses[job_id] = {"status": "error", "error": "Job not found"}
+            elif job.is_finished:
+                statuses[job_id] = {"status": "finished", "result": job.result}
+            elif job.is_failed:
+                statuses[job_id] = {"status": "failed", "error": str(job.exc_info)}
+            elif job.is_started:
+                statuses[job_id] = {"status": "started"}
+            else:
+                statuses[job_id] = {"status": "queued"}
+        return statuses
+
     def get_stats(self) -> dict[str, Any]:
         """Get RQ queue statistics."""
         return {
@@ -23,8 +23,31 @@ def execute_call_task(function_name: str, args: list, kwargs: dict | None = None
 
         logger.info(f"RQ worker completed {function_name}{tuple(args)}{kwargs_str} = {result}")
 
+        _notify_completion()
+
         return result
 
     except Exception as e:
         logger.error(f"RQ worker failed: {e}")
+        _notify_completion()
         raise
+
+
+def _notify_completion() -> None:
+    """
+    Publish a wake-up on the executor's notification channel.
+
+    Lets orchestrator workers blocked on their wake event pick the result
+    up immediately instead of after up to poll_interval. Best-effort: a
+    publish failure must never fail the job itself.
+    """
+    try:
+        from rq import get_current_job
+
+        from durable_monty.executors.rq.executor import RQExecutor
+
+        job = get_current_job()
+        if job is not None:
+            job.connection.publish(RQExecutor.NOTIFY_CHANNEL, job.id)
+    except Exception as e:  # noqa: BLE001 - notification is an optimization only
+        logger.debug(f"Completion notify skipped: {e}")
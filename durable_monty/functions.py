@@ -1,13 +1,27 @@
 """Function execution via dynamic import."""
 
 from typing import Callable, Any
+import functools
 import importlib
 
 
+@functools.lru_cache(maxsize=1024)
+def _resolve(path: str) -> Callable:
+    """Resolve an import path to a function object (cached on success)."""
+    module_path, func_name = path.rsplit(".", 1)
+    module = importlib.import_module(module_path)
+    return getattr(module, func_name)
+
+
 def get_function(path: str) -> Callable:
     """
     Get a function by its full import path via dynamic import.
 
+    Successful lookups are cached, so repeated calls for the same path
+    (the common case for workers executing the same task) skip the
+    import machinery entirely. Call `get_function.cache_clear()` after
+    redeploying code to force re-resolution.
+
     Args:
         path: Full import path like "myapp.tasks.process" or "__main__.add"
 
@@ -24,11 +38,9 @@ def get_function(path: str) -> Callable:
             f"Must be a full import path like 'myapp.tasks.{path}' or '__main__.{path}'."
         )
 
-    # Dynamic import
+    # Dynamic import (cached - failures raise before the cache populates)
     try:
-        module_path, func_name = path.rsplit(".", 1)
-        module = importlib.import_module(module_path)
-        return getattr(module, func_name)
+        return _resolve(path)
     except (ImportError, AttributeError) as e:
         raise KeyError(
             f"Could not import function '{path}'. "
@@ -36,6 +48,10 @@ def get_function(path: str) -> Callable:
         )
 
 
+# Allow cache invalidation after a deploy swaps out module code
+get_function.cache_clear = _resolve.cache_clear  # type: ignore[attr-defined]
+
+
 def execute_function(path: str, args: list, kwargs: dict | None = None) -> Any:
     """
     Execute a function by its full import path.
@@ -49,4 +65,7 @@ def execute_function(path: str, args: list, kwargs: dict | None = None) -> Any:
         Function result
     """
     func = get_function(path)
-    return func(*args, **(kwargs or {}))
+    # Most calls have no kwargs - skip allocating and unpacking an empty dict
+    if kwargs:
+        return func(*args, **kwargs)
+    return func(*args)
@@ -1,22 +1,41 @@
 """Orchestrator service that manages executions."""
 
-import uuid
+import functools
 import inspect
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
 import os
 import sys
 from typing import Any, Callable
 from pathlib import Path
 import pydantic_monty
-from sqlalchemy.orm import Session
-from sqlalchemy import Engine
-
-from durable_monty.models import Execution, Call, ExecutionStatus, CallStatus, to_json, from_json
-
-
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import Engine, String, bindparam, case, cast, func, insert, literal, select, union_all, update
+
+from durable_monty.models import (
+    Execution,
+    Call,
+    ExecutionStatus,
+    CallStatus,
+    to_json,
+    from_json,
+    pack_state,
+    unpack_state,
+)
+
+
+@functools.lru_cache(maxsize=1024)
 def _resolve_function_path(func: Callable) -> str:
     """
     Resolve the full import path for a function, handling __main__ modules.
 
+    Cached by function identity: the sys.path walk below does one
+    filesystem resolve per path entry, and the answer never changes for a
+    given function object within a process.
+
     When a script is run directly (python script.py), functions defined in it
     have __module__ = "__main__". This converts it to the actual module path
     that can be imported by workers.
@@ -76,11 +95,135 @@ def _resolve_function_path(func: Callable) -> str:
         )
 
 
+@functools.lru_cache(maxsize=256)
+def _build_monty(
+    code: str,
+    external_functions: tuple[str, ...],
+    inputs: tuple[str, ...] | None,
+) -> "pydantic_monty.Monty":
+    """
+    Build (or reuse) a Monty interpreter for a piece of workflow code.
+
+    Constructing Monty parses and compiles the source; instances are
+    reusable - each start() yields independent snapshots - so executions
+    running the same code share one compiled instance instead of
+    re-compiling per execution.
+    """
+    return pydantic_monty.Monty(
+        code,
+        external_functions=list(external_functions),
+        inputs=list(inputs) if inputs is not None else None,
+    )
+
+
 class OrchestratorService:
     """Service for managing durable executions."""
 
     def __init__(self, engine: Engine):
         self.engine = engine
+        # One sessionmaker for the service lifetime: avoids re-running session
+        # setup per call, and expire_on_commit=False skips the re-load round
+        # trip after every commit.
+        self.Session = sessionmaker(bind=engine, expire_on_commit=False)
+        # Change listeners (e.g. a Worker's wake event) invoked after commits
+        # that create or finish work, so consumers don't have to rely on
+        # polling latency alone.
+        self._listeners: list[Callable[[], None]] = []
+        # Condition for wait_for_completion: notified whenever an execution
+        # reaches a terminal status through this service instance, so
+        # waiters re-check the row only on actual state changes instead of
+        # polling on a timer.
+        self._completion_cv = threading.Condition()
+        # Function mappings are immutable once an execution is created, so
+        # cache them per execution instead of re-parsing the JSON column on
+        # every resume (bounded, oldest evicted first).
+        self._mapping_cache: OrderedDict[str, dict] = OrderedDict()
+
+        # Hot-path statements, built once per service. Construction (the
+        # Python expression tree) is the per-call cost the engine's compiled
+        # cache can't amortize; with bindparams these are also stable cache
+        # keys, so each compiles exactly once per engine.
+        self._stmt_insert_execution = insert(Execution)
+        self._stmt_execution_info = select(
+            Execution.id, Execution.status, Execution.output
+        ).where(Execution.id == bindparam("b_id"))
+        self._stmt_group_counts = (
+            select(Call.status, func.count())
+            .where(Call.resume_group_id == bindparam("b_group"))
+            .group_by(Call.status)
+        )
+        # Steady-state fast path: one indexed existence probe answers the
+        # common "nothing waiting" poll without running the aggregate join
+        # Resume claim: atomically detach the group from the execution so
+        # exactly one of the racing resume paths (worker poll sweep,
+        # complete_call(s) push) proceeds; the losers match zero rows
+        self._stmt_claim_resume = (
+            update(Execution)
+            .where(
+                Execution.id == bindparam("b_id"),
+                Execution.current_resume_group_id == bindparam("b_group"),
+            )
+            .values(current_resume_group_id=None)
+        )
+        self._stmt_poll_one = select(
+            Execution.status, Execution.current_resume_group_id, Execution.output
+        ).where(Execution.id == bindparam("b_id"))
+        self._stmt_mark_execution_failed = (
+            update(Execution)
+            .where(Execution.id == bindparam("b_id"))
+            .values(status=ExecutionStatus.FAILED)
+        )
+        self._stmt_has_waiting = (
+            select(Execution.id)
+            .where(Execution.status == ExecutionStatus.WAITING)
+            .limit(1)
+        )
+        self._stmt_poll_all = (
+            select(
+                Execution.id,
+                Execution.current_resume_group_id,
+                func.count(Call.id).label("total"),
+                func.sum(
+                    case((Call.status == CallStatus.COMPLETED, 1), else_=0)
+                ).label("completed"),
+                func.sum(
+                    case((Call.status == CallStatus.FAILED, 1), else_=0)
+                ).label("failed"),
+            )
+            .outerjoin(Call, Call.resume_group_id == Execution.current_resume_group_id)
+            .where(Execution.status == ExecutionStatus.WAITING)
+            .group_by(Execution.id)
+        )
+        # Keyset-paged variant: resumes the scan after a cursor id instead
+        # of re-aggregating every waiting row each sweep. Ids are random
+        # hex, so the order is lexicographic rather than creation order -
+        # the cursor bounds per-sweep work and guarantees coverage once
+        # wrapped, not recency.
+        self._stmt_poll_all_page = (
+            self._stmt_poll_all.where(Execution.id > bindparam("b_after"))
+            .order_by(Execution.id)
+            .limit(bindparam("b_limit"))
+        )
+
+    _MAPPING_CACHE_SIZE = 1024
+
+    def _cache_mapping(self, execution_id: str, mapping: dict) -> None:
+        """Remember an execution's function mapping (bounded LRU-ish)."""
+        self._mapping_cache[execution_id] = mapping
+        while len(self._mapping_cache) > self._MAPPING_CACHE_SIZE:
+            self._mapping_cache.popitem(last=False)
+
+    def add_listener(self, callback: Callable[[], None]) -> None:
+        """Register a callback invoked whenever new work may be available."""
+        self._listeners.append(callback)
+
+    def _notify(self) -> None:
+        """Tell listeners that executions or calls changed state."""
+        for callback in self._listeners:
+            try:
+                callback()
+            except Exception:  # noqa: BLE001 - listeners must not break commits
+                pass
 
     def start_execution(
         self,
@@ -103,9 +246,88 @@ class OrchestratorService:
             # Or pass full import paths as strings
             exec_id = service.start_execution(code, ["myapp.tasks.add"])
         """
-        execution_id = str(uuid.uuid4())
+        # Hex form: 4 bytes shorter than the dashed form on every row
+        # and index entry, and skips the dash-formatting step
+        execution_id = secrets.token_hex(16)
+
+        function_mapping = self._build_function_mapping(external_functions)
+
+        with self.Session() as session:
+            # Save mapping to DB - worker will use it. Core insert with the
+            # prebuilt statement: no ORM instance or unit-of-work pass for a
+            # row we never read back here.
+            session.execute(
+                self._stmt_insert_execution,
+                {
+                    "id": execution_id,
+                    "code": code,
+                    "external_functions": function_mapping,
+                    "status": ExecutionStatus.SCHEDULED,
+                    "inputs": to_json(inputs),
+                },
+            )
+            session.commit()
+
+        self._cache_mapping(execution_id, function_mapping)
+        self._notify()
+        return execution_id
+
+    def start_executions(
+        self,
+        code: str,
+        external_functions: list[str | Callable],
+        inputs_list: list[dict | None] | None = None,
+        count: int | None = None,
+    ) -> list[str]:
+        """
+        Schedule many executions of the same code in one transaction.
+
+        Batch form of start_execution: one executemany INSERT and one
+        commit cover the whole batch instead of an INSERT/COMMIT (and
+        fsync) per execution. Returns the execution ids in order.
+
+        Args:
+            code: Python code to execute
+            external_functions: Function names (full paths or callables)
+            inputs_list: Per-execution input dicts (None entries allowed)
+            count: Alternatively, schedule this many executions without inputs
+        """
+        if (inputs_list is None) == (count is None):
+            raise ValueError("Provide exactly one of inputs_list or count")
+        if inputs_list is None:
+            inputs_list = [None] * count
+        if not inputs_list:
+            # An empty executemany parameter list degenerates to a single
+            # valueless INSERT, which fails the NOT NULL constraints
+            return []
+
+        function_mapping = self._build_function_mapping(external_functions)
+        execution_ids = [secrets.token_hex(16) for _ in inputs_list]
+        rows = [
+            {
+                "id": execution_id,
+                "code": code,
+                "external_functions": function_mapping,
+                "status": ExecutionStatus.SCHEDULED,
+                "inputs": to_json(inputs),
+            }
+            for execution_id, inputs in zip(execution_ids, inputs_list)
+        ]
+
+        with self.Session() as session:
+            session.execute(self._stmt_insert_execution, rows)
+            session.commit()
 
-        # Convert callable objects to {short_name: full_path} mapping
+        for execution_id in execution_ids:
+            self._cache_mapping(execution_id, function_mapping)
+        self._notify()
+        return execution_ids
+
+    @staticmethod
+    def _build_function_mapping(
+        external_functions: list[str | Callable],
+    ) -> dict[str, str]:
+        """Convert callables/paths to the stored {short_name: full_path} mapping."""
         function_mapping = {}
         for func in external_functions:
             if callable(func):
@@ -118,59 +340,72 @@ class OrchestratorService:
                 # String path - extract short name
                 short_name = func.rsplit(".", 1)[-1] if "." in func else func
                 function_mapping[short_name] = func
-
-        with Session(self.engine) as session:
-            # Save mapping to DB - worker will use it
-            execution = Execution(
-                id=execution_id,
-                code=code,
-                external_functions=to_json(function_mapping),
-                status=ExecutionStatus.SCHEDULED,
-                inputs=to_json(inputs),
-            )
-            session.add(execution)
-            session.commit()
-            return execution_id
+        return function_mapping
 
     def process_execution(
         self,
         execution_id: str,
         resume_group_id: str | None = None,
-    ) -> None:
+    ) -> tuple[ExecutionStatus, Any] | None:
         """
         Process an execution - handles both scheduled (first start) and waiting (resume).
 
         For scheduled: Starts execution from scratch
         For waiting: Resumes execution with completed results
+
+        Returns:
+            (status, output) after processing - output is only set when the
+            execution completed - or None if nothing was processed. Callers
+            like poll() use this instead of re-querying the row.
         """
-        with Session(self.engine) as session:
-            execution = session.query(Execution).filter_by(id=execution_id).first()
+        with self.Session() as session:
+            execution = session.get(Execution, execution_id)
             if not execution:
-                return
+                return None
 
             # Load function mapping {short_name: full_path} for converting names
-            function_mapping = from_json(execution.external_functions)
+            # (cached per execution - the mapping never changes after creation)
+            function_mapping = self._mapping_cache.get(execution_id)
+            if function_mapping is None:
+                function_mapping = from_json(execution.external_functions) or {}
+                self._cache_mapping(execution_id, function_mapping)
 
             # Get Monty progress based on execution status
             if execution.status == ExecutionStatus.SCHEDULED:
                 # First time - start fresh
                 inputs = from_json(execution.inputs)
-                m = pydantic_monty.Monty(
+                m = _build_monty(
                     execution.code,
-                    external_functions=list(function_mapping.keys()),  # Pass short names to Monty
-                    inputs=list(inputs.keys()) if inputs else None,
+                    tuple(function_mapping),  # Pass short names to Monty
+                    tuple(inputs) if inputs else None,
                 )
                 progress = m.start(inputs=inputs) if inputs else m.start()
 
             elif execution.status == ExecutionStatus.WAITING:
                 # Resume with results
                 if not resume_group_id:
-                    return
+                    return None
+
+                # Claim the resume before touching the snapshot: both the
+                # completion push and the worker's poll sweep can observe
+                # the same group finishing, and an unclaimed double resume
+                # would insert (and execute) every external call twice.
+                # Uncommitted until the final state write lands in the same
+                # transaction: racers block on the row lock (or SQLite's
+                # busy_timeout) and then match zero rows, while a failed
+                # resume rolls the claim back and stays retryable instead
+                # of stranding the execution with no group.
+                claimed = session.execute(
+                    self._stmt_claim_resume,
+                    {"b_id": execution_id, "b_group": resume_group_id},
+                )
+                if claimed.rowcount == 0:
+                    return None
 
                 # Load completed results
                 calls = (
                     session.query(Call)
-                    .filter_by(resume_group_id=resume_group_id, status=ExecutionStatus.COMPLETED)
+                    .filter_by(resume_group_id=resume_group_id, status=CallStatus.COMPLETED)
                     .all()
                 )
                 results = {
@@ -179,12 +414,12 @@ class OrchestratorService:
                 }
 
                 # Deserialize and resume
-                progress = pydantic_monty.MontyFutureSnapshot.load(execution.state)
+                progress = pydantic_monty.MontyFutureSnapshot.load(unpack_state(execution.state))
                 progress = progress.resume(results=results)
 
             else:
                 # Invalid status
-                return
+                return None
 
             # Collect all external calls and mark as futures
             pending_calls = {}
@@ -203,39 +438,58 @@ class OrchestratorService:
                 execution.status = ExecutionStatus.COMPLETED
                 execution.output = to_json(progress.output)
                 session.commit()
+                self._signal_finished()
+                return ExecutionStatus.COMPLETED, progress.output
 
             elif isinstance(progress, pydantic_monty.MontyFutureSnapshot):
                 # More external calls needed - create new resume group
-                new_resume_group_id = str(uuid.uuid4())
-                execution.state = progress.dump()
+                new_resume_group_id = secrets.token_hex(16)
+                execution.state = pack_state(progress.dump())
                 execution.status = ExecutionStatus.WAITING
                 execution.current_resume_group_id = new_resume_group_id
 
-                # Save all calls in this group
+                # Save all calls in this group in one bulk insert - skips
+                # per-row ORM unit-of-work bookkeeping on large fan-outs and
+                # lets the dialect use its fast executemany / insertmanyvalues
+                rows = []
                 for call_id in progress.pending_call_ids:
                     call_info = pending_calls[call_id]
-                    # Convert short name to full path for execution
                     short_name = call_info["function"]
-                    full_path = function_mapping.get(short_name, short_name)
-                    call = Call(
-                        execution_id=execution_id,
-                        resume_group_id=new_resume_group_id,
-                        call_id=call_id,
-                        function_name=full_path,  # Store full path for RQ workers
-                        args=to_json(call_info["args"]),
-                        kwargs=to_json(call_info["kwargs"]),
-                        status=CallStatus.PENDING,
-                    )
-                    session.add(call)
+                    rows.append({
+                        "execution_id": execution_id,
+                        "resume_group_id": new_resume_group_id,
+                        "call_id": call_id,
+                        # Convert short name to full path for RQ workers
+                        "function_name": function_mapping.get(short_name, short_name),
+                        "args": to_json(call_info["args"]),
+                        "kwargs": to_json(call_info["kwargs"]),
+                        "status": CallStatus.PENDING,
+                    })
+                session.execute(insert(Call), rows)
 
                 session.commit()
+                # The freshly inserted PENDING calls are new work: wake
+                # listening workers now instead of letting the batch sit
+                # until the next poll_interval tick
+                self._notify()
+                return ExecutionStatus.WAITING, None
 
-    def poll(self, execution_id: str | None = None) -> dict[str, Any] | list[dict[str, Any]]:
+    def poll(
+        self,
+        execution_id: str | None = None,
+        after_id: str | None = None,
+        limit: int | None = None,
+    ) -> dict[str, Any] | list[dict[str, Any]]:
         """
         Poll execution status and resume if ready.
 
         Args:
             execution_id: Specific execution to poll, or None to poll all waiting executions
+            after_id: With execution_id=None, only consider waiting
+                executions with id greater than this (keyset cursor); pass
+                the last id of the previous page to continue a sweep
+            limit: With execution_id=None, cap the sweep at this many
+                waiting executions; None scans them all
 
         Returns:
             Single execution: {
@@ -248,122 +502,428 @@ class OrchestratorService:
         """
         if execution_id is None:
             # Poll all waiting executions
-            return self._poll_all()
+            return self._poll_all(after_id=after_id, limit=limit)
+
+        # Iterative rather than recursive: a workflow that resumes through
+        # several resume groups in one poll loops here in a single session
+        # instead of stacking frames and sessions per level.
+        with self.Session() as session:
+            while True:
+                result = self._poll_once(execution_id, session)
+                if result is not None:
+                    return result
+                # process_execution committed in its own session - end this
+                # one's read transaction so the next pass starts a fresh
+                # snapshot (under REPEATABLE READ the old one would keep
+                # showing pre-resume state and loop forever)
+                session.rollback()
+
+    def _poll_once(self, execution_id: str, session: Session) -> dict[str, Any] | None:
+        """One poll step; returns a result dict, or None to poll again after a resume."""
+        # Core single-row read of just the three columns this needs - no
+        # ORM hydration or identity-map entry for a status check
+        execution = session.execute(
+            self._stmt_poll_one, {"b_id": execution_id}
+        ).first()
+        if not execution:
+            raise ValueError(f"Execution {execution_id} not found")
+
+        # If completed or failed, return result
+        if execution.status in (ExecutionStatus.COMPLETED, ExecutionStatus.FAILED):
+            return {
+                "execution_id": execution_id,
+                "status": execution.status,
+                "output": from_json(execution.output),
+                "pending_calls": [],
+            }
 
-        with Session(self.engine) as session:
-            execution = session.query(Execution).filter_by(id=execution_id).first()
-            if not execution:
-                raise ValueError(f"Execution {execution_id} not found")
+        # Check if all calls in current resume group are completed
+        resume_group_id = execution.current_resume_group_id
+        if not resume_group_id:
+            return {
+                "execution_id": execution_id,
+                "status": "pending",
+                "output": None,
+                "pending_calls": [],
+            }
 
-            # If completed or failed, return result
-            if execution.status in (ExecutionStatus.COMPLETED, ExecutionStatus.FAILED):
-                return {
-                    "execution_id": execution_id,
-                    "status": execution.status,
-                    "output": from_json(execution.output),
-                    "pending_calls": [],
+        # Count per status in SQL instead of pulling every row (and its
+        # JSON payloads) into Python just to count them
+        counts = dict(
+            session.execute(
+                self._stmt_group_counts, {"b_group": resume_group_id}
+            ).all()
+        )
+        total = sum(counts.values())
+        completed = counts.get(CallStatus.COMPLETED, 0)
+        failed = counts.get(CallStatus.FAILED, 0)
+
+        # Not all done yet - only now fetch the pending detail rows.
+        # Core column select: no ORM instance construction for rows we
+        # only serialize into dicts.
+        if total != completed + failed:
+            pending = [
+                {
+                    "call_id": row.call_id,
+                    "function_name": row.function_name,
+                    "args": from_json(row.args),
+                    "kwargs": from_json(row.kwargs),
+                    "status": row.status,
                 }
+                for row in session.execute(
+                    select(
+                        Call.call_id, Call.function_name, Call.args, Call.kwargs, Call.status
+                    ).where(
+                        Call.resume_group_id == resume_group_id,
+                        Call.status == CallStatus.PENDING,
+                    )
+                )
+            ]
+            return {
+                "execution_id": execution_id,
+                "status": "pending",
+                "output": None,
+                "pending_calls": pending,
+            }
 
-            # Check if all calls in current resume group are completed
-            resume_group_id = execution.current_resume_group_id
-            if not resume_group_id:
-                return {
-                    "execution_id": execution_id,
-                    "status": "pending",
-                    "output": None,
-                    "pending_calls": [],
-                }
+        # All done - check for failures
+        if failed > 0:
+            session.execute(self._stmt_mark_execution_failed, {"b_id": execution_id})
+            session.commit()
+            self._signal_finished()
+            return {
+                "execution_id": execution_id,
+                "status": "failed",
+                "output": None,
+                "pending_calls": [],
+            }
 
-            calls = session.query(Call).filter_by(resume_group_id=resume_group_id).all()
+        # All completed - resume! process_execution reports the outcome
+        # so we don't re-query the row it just updated.
+        outcome = self.process_execution(execution_id, resume_group_id)
 
-            total = len(calls)
-            completed = sum(1 for c in calls if c.status == CallStatus.COMPLETED)
-            failed = sum(1 for c in calls if c.status == CallStatus.FAILED)
-            pending = [
-                {
-                    "call_id": c.call_id,
-                    "function_name": c.function_name,
-                    "args": from_json(c.args),
-                    "kwargs": from_json(c.kwargs),
-                    "status": c.status,
-                }
-                for c in calls
-                if c.status == CallStatus.PENDING
+        if outcome and outcome[0] == ExecutionStatus.COMPLETED:
+            return {
+                "execution_id": execution_id,
+                "status": "completed",
+                "output": outcome[1],
+                "pending_calls": [],
+            }
+
+        # Resumed to another waiting state - poll again
+        return None
+
+    def _poll_all(
+        self, after_id: str | None = None, limit: int | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Poll all waiting executions (optionally one keyset page of them).
+
+        One aggregate join computes per-execution completed/failed/total
+        counts in SQL, one follow-up query fetches the pending detail rows
+        for the still-waiting groups, and only executions whose resume
+        group has actually finished take the per-execution poll() path
+        (which resumes). With a limit, the scan pages by id so repeated
+        sweeps under a large waiting backlog each do bounded work.
+        """
+        with self.Session() as session:
+            # Fast path: a single probe of the partial status index beats
+            # the aggregate outer join when nothing is waiting - the
+            # dominant case for an idle or drained system
+            if session.execute(self._stmt_has_waiting).first() is None:
+                return []
+            if limit is not None:
+                rows = session.execute(
+                    self._stmt_poll_all_page,
+                    {"b_after": after_id or "", "b_limit": limit},
+                ).all()
+            else:
+                rows = session.execute(self._stmt_poll_all).all()
+
+            waiting = [
+                row for row in rows
+                if not row.total or row.total != (row.completed or 0) + (row.failed or 0)
             ]
 
-            # Not all done yet
-            if total != completed + failed:
-                return {
-                    "execution_id": execution_id,
+            # One query for the pending detail of every still-waiting group
+            pending_by_group: dict[str, list[dict]] = {}
+            if waiting:
+                group_ids = [row.current_resume_group_id for row in waiting]
+                detail = session.execute(
+                    select(
+                        Call.resume_group_id,
+                        Call.call_id,
+                        Call.function_name,
+                        Call.args,
+                        Call.kwargs,
+                        Call.status,
+                    ).where(
+                        Call.resume_group_id.in_(group_ids),
+                        Call.status == CallStatus.PENDING,
+                    )
+                )
+                for d in detail:
+                    pending_by_group.setdefault(d.resume_group_id, []).append({
+                        "call_id": d.call_id,
+                        "function_name": d.function_name,
+                        "args": from_json(d.args),
+                        "kwargs": from_json(d.kwargs),
+                        "status": d.status,
+                    })
+
+        results = []
+        for row in rows:
+            if row.total and row.total == (row.completed or 0) + (row.failed or 0):
+                # Ready to resume (or fail) - go through the full path
+                results.append(self.poll(row.id))
+            else:
+                results.append({
+                    "execution_id": row.id,
                     "status": "pending",
                     "output": None,
-                    "pending_calls": pending,
-                }
+                    "pending_calls": pending_by_group.get(row.current_resume_group_id, []),
+                })
+        return results
 
-            # All done - check for failures
-            if failed > 0:
-                execution.status = ExecutionStatus.FAILED
-                session.commit()
-                return {
-                    "execution_id": execution_id,
-                    "status": "failed",
-                    "output": None,
-                    "pending_calls": [],
-                }
+    def fetch_work_batch(
+        self,
+        limit_scheduled: int = 100,
+        limit_pending: int = 10,
+        limit_submitted: int = 50,
+        session: Session | None = None,
+    ) -> dict[str, list]:
+        """
+        Fetch one tick's worth of work ids in a single round-trip.
 
-            # All completed - resume!
-            self.process_execution(execution_id, resume_group_id)
+        One UNION ALL across the three status filters replaces the three
+        separate scans a worker tick used to issue - one query, one lock
+        acquisition. Returns ids tagged by kind; callers load the detail
+        rows for the ids they act on.
 
-            # Re-query to get updated status
-            execution = session.query(Execution).filter_by(id=execution_id).first()
+        Returns:
+            {"scheduled": [execution_id, ...],
+             "pending": [call row id, ...],
+             "submitted": [call row id, ...]}
+        """
+        # Each LIMITed arm is wrapped as a subquery: SQLite rejects
+        # parenthesized SELECT ... LIMIT directly inside a compound
+        stmt = union_all(
+            select(
+                select(literal("scheduled").label("kind"), Execution.id.label("id"))
+                .where(Execution.status == ExecutionStatus.SCHEDULED)
+                .limit(limit_scheduled)
+                .subquery()
+            ),
+            # Call pks are integers - cast so the UNION columns line up
+            select(
+                select(literal("pending").label("kind"), cast(Call.id, String).label("id"))
+                .where(Call.status == CallStatus.PENDING)
+                .limit(limit_pending)
+                .subquery()
+            ),
+            select(
+                select(literal("submitted").label("kind"), cast(Call.id, String).label("id"))
+                .where(Call.status == CallStatus.SUBMITTED, Call.job_id.isnot(None))
+                .limit(limit_submitted)
+                .subquery()
+            ),
+        )
 
-            if execution.status == ExecutionStatus.COMPLETED:
-                return {
-                    "execution_id": execution_id,
-                    "status": "completed",
-                    "output": from_json(execution.output),
-                    "pending_calls": [],
-                }
-            else:
-                # Resumed to another waiting state
-                return self.poll(execution_id)
+        if session is not None:
+            rows = session.execute(stmt).all()
+        else:
+            with self.Session() as own_session:
+                rows = own_session.execute(stmt).all()
 
-    def _poll_all(self) -> list[dict[str, Any]]:
-        """Poll all waiting executions."""
-        with Session(self.engine) as session:
-            executions = session.query(Execution).filter_by(status=ExecutionStatus.WAITING).all()
-            return [self.poll(e.id) for e in executions]
+        batch: dict[str, list] = {"scheduled": [], "pending": [], "submitted": []}
+        for kind, row_id in rows:
+            batch[kind].append(row_id if kind == "scheduled" else int(row_id))
+        return batch
 
     def get_pending_calls(self, execution_id: str) -> list[dict]:
         """Get all pending calls for an execution."""
-        with Session(self.engine) as session:
-            calls = (
-                session.query(Call)
-                .filter_by(execution_id=execution_id, status=CallStatus.PENDING)
-                .all()
+        with self.Session() as session:
+            rows = session.execute(
+                select(Call.call_id, Call.function_name, Call.args, Call.kwargs).where(
+                    Call.execution_id == execution_id,
+                    Call.status == CallStatus.PENDING,
+                )
             )
             return [
                 {
-                    "call_id": c.call_id,
-                    "function_name": c.function_name,
-                    "args": from_json(c.args),
-                    "kwargs": from_json(c.kwargs),
+                    "call_id": row.call_id,
+                    "function_name": row.function_name,
+                    "args": from_json(row.args),
+                    "kwargs": from_json(row.kwargs),
                 }
-                for c in calls
+                for row in rows
             ]
 
     def complete_call(self, execution_id: str, call_id: int, result: Any) -> None:
-        """Mark a call as completed with a result."""
-        with Session(self.engine) as session:
-            call = (
+        """
+        Mark a call as completed with a result.
+
+        If this was the last unfinished call in its resume group, the
+        execution is resumed immediately (push instead of poll), so
+        completions don't wait for the next worker poll cycle.
+        """
+        resume_group_id = None
+        with self.Session() as session:
+            # Guarded UPDATE: a duplicate completion (executor retry, double
+            # webhook) matches zero rows and becomes a no-op instead of
+            # rewriting the result and double-resuming the execution.
+            updated = session.execute(
+                update(Call)
+                .where(
+                    Call.execution_id == execution_id,
+                    Call.call_id == call_id,
+                    Call.status != CallStatus.COMPLETED,
+                )
+                .values(
+                    status=CallStatus.COMPLETED,
+                    result=to_json(result),
+                    completed_at=datetime.now(timezone.utc),
+                )
+            )
+            session.commit()
+
+            if updated.rowcount == 0:
+                return
+
+            # Check whether the whole resume group is now complete
+            group_id = session.execute(
+                select(Call.resume_group_id).where(
+                    Call.execution_id == execution_id, Call.call_id == call_id
+                )
+            ).scalar()
+            remaining = (
                 session.query(Call)
-                .filter_by(execution_id=execution_id, call_id=call_id)
-                .first()
+                .filter(
+                    Call.resume_group_id == group_id,
+                    Call.status != CallStatus.COMPLETED,
+                )
+                .count()
             )
-            if call:
-                call.status = CallStatus.COMPLETED
-                call.result = to_json(result)
-                session.commit()
+            if remaining == 0:
+                resume_group_id = group_id
+
+        self._notify()
+        if resume_group_id:
+            self.process_execution(execution_id, resume_group_id)
+
+    def complete_calls(self, completions: list[tuple[str, int, Any]]) -> None:
+        """
+        Mark many calls completed in one transaction.
+
+        Batch form of complete_call for executors that report several
+        finished jobs per tick: one executemany UPDATE and one commit
+        instead of a BEGIN/UPDATE/COMMIT cycle per call. Executions whose
+        resume group finished as a result are resumed afterwards.
+
+        Args:
+            completions: (execution_id, call_id, result) per finished call
+        """
+        if not completions:
+            return
+
+        to_resume = []
+        with self.Session() as session:
+            # Same duplicate-completion guard as complete_call, applied
+            # per parameter set by the executemany
+            # Executed on the connection: the ORM session layer doesn't
+            # support executemany UPDATEs with extra WHERE criteria, and
+            # nothing here is loaded as ORM objects anyway
+            session.connection().execute(
+                update(Call)
+                .where(
+                    Call.execution_id == bindparam("b_execution_id"),
+                    Call.call_id == bindparam("b_call_id"),
+                    Call.status != CallStatus.COMPLETED,
+                )
+                .values(
+                    status=CallStatus.COMPLETED,
+                    result=bindparam("b_result"),
+                    completed_at=datetime.now(timezone.utc),
+                ),
+                [
+                    {"b_execution_id": execution_id, "b_call_id": call_id, "b_result": to_json(result)}
+                    for execution_id, call_id, result in completions
+                ],
+            )
+            session.commit()
+
+            # One pass to find resume groups with nothing left unfinished
+            execution_ids = {execution_id for execution_id, _, _ in completions}
+            waiting = session.execute(
+                select(Execution.id, Execution.current_resume_group_id).where(
+                    Execution.id.in_(execution_ids),
+                    Execution.status == ExecutionStatus.WAITING,
+                )
+            ).all()
+            group_ids = [row.current_resume_group_id for row in waiting if row.current_resume_group_id]
+            remaining = dict(
+                session.execute(
+                    select(Call.resume_group_id, func.count())
+                    .where(
+                        Call.resume_group_id.in_(group_ids),
+                        Call.status != CallStatus.COMPLETED,
+                    )
+                    .group_by(Call.resume_group_id)
+                ).all()
+            ) if group_ids else {}
+            to_resume = [
+                (row.id, row.current_resume_group_id)
+                for row in waiting
+                if row.current_resume_group_id
+                and remaining.get(row.current_resume_group_id, 0) == 0
+            ]
+
+        self._notify()
+        for execution_id, resume_group_id in to_resume:
+            self.process_execution(execution_id, resume_group_id)
+
+    def _signal_finished(self) -> None:
+        """Wake wait_for_completion callers after a terminal status write."""
+        with self._completion_cv:
+            self._completion_cv.notify_all()
+
+    def wait_for_completion(
+        self, execution_id: str, timeout: float | None = None
+    ) -> dict[str, Any]:
+        """
+        Block until an execution reaches a terminal status.
+
+        Event-driven alternative to polling poll()/get_execution in a
+        loop: the caller sleeps on a condition variable and re-reads the
+        row only when this service records a completion or failure.
+        Completions applied through a different process still land - the
+        row check runs on every wake - but only wake this instance's
+        waiters, so cross-process callers should keep a poll loop.
+
+        Args:
+            execution_id: Execution to wait for
+            timeout: Max seconds to wait, or None to wait indefinitely
+
+        Returns:
+            get_execution() payload for the finished execution
+
+        Raises:
+            ValueError: If execution not found
+            TimeoutError: If the execution is still running after `timeout`
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self._completion_cv:
+            while True:
+                info = self.get_execution(execution_id)
+                if info["status"] in (ExecutionStatus.COMPLETED, ExecutionStatus.FAILED):
+                    return info
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(
+                        f"Execution {execution_id} did not finish within {timeout}s "
+                        f"(status: {info['status'].value})"
+                    )
+                self._completion_cv.wait(remaining)
 
     def get_execution(self, execution_id: str) -> dict[str, Any]:
         """
@@ -380,16 +940,21 @@ class OrchestratorService:
         Raises:
             ValueError: If execution not found
         """
-        with Session(self.engine) as session:
-            execution = session.query(Execution).filter_by(id=execution_id).first()
-            if not execution:
+        with self.Session() as session:
+            # Column select: skips hauling the code and state blob off disk
+            # for what is a status read
+            row = session.execute(
+                self._stmt_execution_info, {"b_id": execution_id}
+            ).first()
+            if not row:
                 raise ValueError(f"Execution {execution_id} not found")
 
             return {
-                "execution_id": execution.id,
-                "status": execution.status,
-                "output": from_json(execution.output) if execution.output else None,
-                "error": execution.error if hasattr(execution, "error") else None,
+                "execution_id": row.id,
+                "status": row.status,
+                "output": from_json(row.output) if row.output else None,
+                # Execution has no error column; kept for payload stability
+                "error": None,
             }
 
     def get_result(self, execution_id: str) -> Any:
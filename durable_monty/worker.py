@@ -1,13 +1,16 @@
 """Worker for executing durable functions."""
 
 import logging
+import queue
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable
+from sqlalchemy import bindparam, func, select, update
 from sqlalchemy.orm import Session
 
 from durable_monty.service import OrchestratorService
-from durable_monty.models import Execution, Call, ExecutionStatus, CallStatus, from_json
+from durable_monty.models import Execution, Call, ExecutionStatus, CallStatus
 from durable_monty.executor import Executor, LocalExecutor
 
 logger = logging.getLogger(__name__)
@@ -21,11 +24,130 @@ class Worker:
         service: OrchestratorService,
         executor: Executor,
         poll_interval: float = 1.0,
+        phase_workers: int = 1,
+        max_poll_interval: float | None = None,
+        max_in_flight: int = 128,
+        batch_size: int = 100,
+        complete_batch_delay: float = 0.0,
     ):
+        """
+        Args:
+            service: Orchestrator service to process work for
+            executor: Executor that runs the external function calls
+            poll_interval: Seconds to wait between iterations when idle
+            phase_workers: Run the tick phases on this many threads.
+                The default (1) keeps phases serial on one session; >1
+                overlaps the DB-bound and executor-bound phases so a tick
+                costs max(phase) instead of sum(phase) wall time.
+            max_poll_interval: When set, idle ticks back off exponentially
+                from poll_interval up to this cap and reset on work, so
+                idle workers stop hammering the database. Wake
+                notifications still interrupt the wait immediately; leave
+                None when relying on pure polling against a database other
+                processes write to without notifications.
+            max_in_flight: Cap on concurrently submitted calls. Submission
+                pauses at the cap and resumes as jobs finish, so bursty
+                fan-outs can't oversubscribe the executor's queue.
+            batch_size: Scheduled executions claimed per batch. One round
+                trip starts up to this many executions; raise it to drain
+                big backlogs with fewer queries.
+            complete_batch_delay: Seconds to linger after the first pushed
+                completion of a tick so near-simultaneous ones (a gather
+                fan-out finishing together) land in the same flush. 0
+                flushes immediately; the delay trades that much latency
+                for fewer commits under load.
+        """
         self.service = service
         self.executor = executor
         self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.max_in_flight = max_in_flight
+        self.batch_size = batch_size
+        self.complete_batch_delay = complete_batch_delay
+        # Optional observer called after every loop iteration with whether
+        # the iteration found work - a deterministic signal for tests and
+        # metrics. No cost on the hot path when left unset.
+        self.on_processed: Callable[[bool], None] | None = None
+        self._cur_interval = poll_interval
+        # Keyset cursor for the waiting sweep: each tick polls one page of
+        # waiting executions after this id, wrapping when a page comes up
+        # short, so sweep cost stays O(batch) however many are waiting
+        self._poll_cursor: str | None = None
+        self._pool = (
+            ThreadPoolExecutor(max_workers=phase_workers, thread_name_prefix="worker-phase")
+            if phase_workers > 1
+            else None
+        )
+        # Reuse the service's configured sessionmaker (expire_on_commit
+        # off, bound once) instead of re-running Session setup per tick
+        self._session_factory = service.Session
         self._stop_event = threading.Event()
+        # Woken by the service when new work arrives, so state changes are
+        # picked up immediately instead of after up to poll_interval
+        self._wake = threading.Event()
+        service.add_listener(self._wake.set)
+        # Executors with out-of-process completion signals (RQ pub/sub)
+        # feed the same wake event
+        if hasattr(executor, "add_listener"):
+            executor.add_listener(self._wake.set)
+        # Executor capabilities are fixed for the worker's lifetime, so
+        # resolve the batch-check method to a bound handle once (or None
+        # for executors without job checking) instead of hasattr() plus
+        # attribute resolution on every tick
+        self._check_jobs = executor.check_jobs if hasattr(executor, "check_job") else None
+        # Row-level locking with SKIP LOCKED lets concurrent workers claim
+        # disjoint batches; SQLite has no row locks, so single-worker there
+        self._supports_skip_locked = service.engine.dialect.name in (
+            "postgresql",
+            "mysql",
+            "mariadb",
+        )
+        # The per-tick statements are identical every tick, so build the
+        # expression trees once here; executions bind parameters only
+        # (expanding bindparams cover the IN lists)
+        self._stmt_scheduled = self._claim(
+            select(Execution.id)
+            .where(Execution.status == ExecutionStatus.SCHEDULED)
+            .limit(bindparam("b_limit"))
+        )
+        self._stmt_pending_detail = self._claim(
+            select(
+                Call.id,
+                Call.execution_id,
+                Call.call_id,
+                Call.function_name,
+                Call.args,
+                Call.kwargs,
+            ).where(
+                Call.id.in_(bindparam("b_ids", expanding=True)),
+                Call.status == CallStatus.PENDING,
+            )
+        )
+        self._stmt_submitted_detail = self._claim(
+            select(
+                Call.id, Call.execution_id, Call.call_id, Call.function_name, Call.job_id
+            ).where(
+                Call.id.in_(bindparam("b_ids", expanding=True)),
+                Call.status == CallStatus.SUBMITTED,
+            )
+        )
+        self._stmt_in_flight = select(func.count()).where(Call.status == CallStatus.SUBMITTED)
+        self._stmt_mark_submitted = (
+            update(Call)
+            .where(Call.id == bindparam("b_id"))
+            .values(job_id=bindparam("b_job_id"), status=CallStatus.SUBMITTED)
+        )
+        self._stmt_mark_failed = (
+            update(Call)
+            .where(Call.id == bindparam("b_id"))
+            .values(status=CallStatus.FAILED, error=bindparam("b_error"))
+        )
+
+    def _claim(self, query):
+        """Add FOR UPDATE SKIP LOCKED on backends that support it."""
+        if self._supports_skip_locked:
+            return query.with_for_update(skip_locked=True)
+        return query
 
     def run(self, once: bool = False, until_complete: bool = False) -> None:
         """
@@ -50,113 +172,271 @@ class Worker:
 
         while not self._stop_event.is_set():
             try:
-                self._process_one_iteration()
+                work_done = self._process_one_iteration()
+                if self.on_processed is not None:
+                    self.on_processed(work_done)
 
                 # Check if we should stop (until_complete mode)
                 if until_complete and not self._has_active_executions():
                     logger.info("All executions completed, worker stopped")
                     break
 
-                # Wait for poll_interval or until stop is signaled
-                self._stop_event.wait(timeout=self.poll_interval)
+                # Wait for new work, the (possibly backed-off) interval,
+                # or stop - whichever first
+                self._wake.wait(timeout=self._next_interval(work_done))
+                self._wake.clear()
 
             except KeyboardInterrupt:
                 logger.info("Worker stopping...")
                 self.stop()
             except Exception as e:
                 logger.error(f"Worker error: {e}", exc_info=True)
-                self._stop_event.wait(timeout=self.poll_interval)
+                self._wake.wait(timeout=self.poll_interval)
+                self._wake.clear()
 
         if not until_complete:
             logger.info("Worker stopped")
 
-    def _process_one_iteration(self) -> None:
-        """Process one iteration of work."""
-        self._process_scheduled()
-        self._process_pending_calls()
-        self._process_submitted_jobs()
-        self._process_waiting()
+    def _process_one_iteration(self) -> bool:
+        """
+        Process one iteration of work. Returns True if any work was found.
+
+        Serial mode: one session (one pooled connection, one transaction
+        scope) spans the scheduled/pending/submitted phases instead of
+        each phase opening its own; _process_waiting goes through
+        service.poll which manages its own session. With phase_workers >
+        1 the phases run concurrently, each on its own session.
+        """
+        # Pushed completions first: they may finish resume groups and
+        # spare the submitted phase a status round-trip
+        did_pushed = self._drain_completions()
+
+        if self._pool is None:
+            with self._session_factory() as session:
+                # One UNION ALL round-trip collects every phase's batch of ids
+                batch = self.service.fetch_work_batch(
+                    limit_scheduled=self.batch_size, session=session
+                )
+                did_scheduled = self._process_scheduled(session, batch["scheduled"])
+                did_pending = self._process_pending_calls(session, batch["pending"])
+                did_submitted = self._process_submitted_jobs(session, batch["submitted"])
+            self._process_waiting()
+            return did_pushed or did_scheduled or did_pending or did_submitted
+
+        batch = self.service.fetch_work_batch(limit_scheduled=self.batch_size)
+        futures = [
+            self._pool.submit(self._run_phase, self._process_scheduled, batch["scheduled"]),
+            self._pool.submit(self._run_phase, self._process_pending_calls, batch["pending"]),
+            self._pool.submit(self._run_phase, self._process_submitted_jobs, batch["submitted"]),
+            self._pool.submit(self._process_waiting),
+        ]
+        # Await every phase before reducing: a lazy any() would stop at the
+        # first truthy result, leaving phases running into the next tick
+        # and swallowing their exceptions
+        results = [future.result() for future in futures]
+        return any(bool(result) for result in results) or did_pushed
+
+    def _drain_completions(self) -> bool:
+        """
+        Drain completions the executor pushed (see Executor.completion_queue).
 
-    def _process_scheduled(self) -> None:
-        """Start scheduled executions."""
-        with Session(self.service.engine) as session:
-            scheduled = session.query(Execution).filter_by(status=ExecutionStatus.SCHEDULED).all()
+        Push beats poll: results land without a per-job status check, and
+        the periodic submitted-jobs sweep remains as the fallback for
+        executors (or failures) that don't go through the queue.
+        """
+        if self.executor.completion_queue is None:
+            return False
 
-            for execution in scheduled:
+        finished = []
+        while True:
+            try:
+                finished.append(self.executor.completion_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        if finished and self.complete_batch_delay > 0:
+            # Debounce: siblings of a fan-out usually finish within a few
+            # ms of each other - linger briefly so they share one flush
+            time.sleep(self.complete_batch_delay)
+            while True:
                 try:
-                    logger.info(f"Starting execution {execution.id[:8]}...")
-                    self.service.process_execution(execution.id)
-                except Exception as e:
-                    logger.error(f"Error starting {execution.id[:8]}: {e}")
+                    finished.append(self.executor.completion_queue.get_nowait())
+                except queue.Empty:
+                    break
 
-    def _process_pending_calls(self) -> None:
-        """Submit pending calls to executor."""
-        with Session(self.service.engine) as session:
-            pending_calls = session.query(Call).filter_by(status=CallStatus.PENDING).limit(10).all()
+        if finished:
+            self.service.complete_calls(finished)
+        return bool(finished)
+
+    def _run_phase(self, phase: Callable[[Session, list], "bool | None"], ids: list):
+        """Run one phase with its own session (sessions aren't thread-safe)."""
+        with self._session_factory() as session:
+            return phase(session, ids)
+
+    def _next_interval(self, work_done: bool) -> float:
+        """How long to wait before the next tick (exponential idle backoff)."""
+        if self.max_poll_interval is None:
+            return self.poll_interval
+        if work_done:
+            self._cur_interval = self.poll_interval
+        else:
+            self._cur_interval = min(self._cur_interval * 2, self.max_poll_interval)
+        return self._cur_interval
+
+    def _process_scheduled(self, session: Session, execution_ids: list[str]) -> bool:
+        """
+        Start scheduled executions, seeded by the combined work batch.
 
-            for call in pending_calls:
+        Processes in bounded batches of ids instead of materializing every
+        scheduled row (and its code/state columns) into memory at once, so
+        peak memory stays O(batch) on a large backlog; a backlog larger
+        than one batch is drained by re-fetching.
+        """
+        attempted: set[str] = set()
+        while True:
+            # Skip ids that stayed scheduled after a failed attempt this tick
+            new_ids = [eid for eid in execution_ids if eid not in attempted]
+            if not new_ids:
+                break
+
+            for execution_id in new_ids:
+                attempted.add(execution_id)
                 try:
-                    # Submit to executor with function_name, args, and kwargs
-                    args = from_json(call.args)
-                    kwargs = from_json(call.kwargs)
-                    job_id = self.executor.submit_call(call.function_name, args, kwargs)
+                    logger.info(f"Starting execution {execution_id[:8]}...")
+                    self.service.process_execution(execution_id)
+                except Exception as e:
+                    logger.error(f"Error starting {execution_id[:8]}: {e}")
+
+            # Fetch the next slice; returns nothing new once drained
+            rows = session.execute(self._stmt_scheduled, {"b_limit": self.batch_size}).all()
+            # End the claiming transaction before processing: on
+            # Postgres/MySQL the FOR UPDATE locks would otherwise block
+            # process_execution's own session on these very rows - a
+            # self-deadlock. The lock only arbitrates the fetch itself;
+            # concurrent workers that fetch afterwards are deduped by the
+            # scheduled->waiting status transition.
+            session.rollback()
+            execution_ids = [row.id for row in rows]
+
+        return bool(attempted)
+
+    def _process_pending_calls(self, session: Session, call_ids: list[int]) -> bool:
+        """
+        Submit pending calls to executor (row ids from the combined batch).
 
-                    # Store job_id
-                    call.job_id = job_id
-                    call.status = CallStatus.SUBMITTED
-                    session.commit()
+        Reads and writes go through Core: the detail load returns plain
+        column tuples (no ORM instance construction or identity-map
+        bookkeeping for rows we touch once), and status changes are
+        batched UPDATEs. The status filter is re-applied - and the rows
+        claimed - at load time in case another worker got there first.
+        """
+        if not call_ids:
+            return False
+
+        # Flow control: never exceed max_in_flight submitted jobs, so a
+        # burst of pending calls can't oversubscribe the executor
+        in_flight = session.execute(self._stmt_in_flight).scalar()
+        allowed = self.max_in_flight - (in_flight or 0)
+        if allowed <= 0:
+            return False
+        call_ids = call_ids[:allowed]
+
+        pending_calls = session.execute(self._stmt_pending_detail, {"b_ids": call_ids}).all()
+
+        submitted_params = []
+        failed_params = []
+        for call in pending_calls:
+            try:
+                # args/kwargs come decoded straight off the JSON columns
+                job_id = self.executor.submit_call(
+                    call.function_name,
+                    call.args,
+                    call.kwargs,
+                    execution_id=call.execution_id,
+                    call_id=call.call_id,
+                )
+                submitted_params.append({"b_id": call.id, "b_job_id": job_id})
 
-                except Exception as e:
-                    # Mark as failed
-                    logger.error(f"Failed to submit call {call.call_id}: {e}")
-                    call.status = CallStatus.FAILED
-                    call.error = str(e)
-                    session.commit()
-
-    def _process_submitted_jobs(self) -> None:
-        """Check submitted jobs and update completed ones."""
+            except Exception as e:
+                # Mark as failed
+                logger.error(f"Failed to submit call {call.call_id}: {e}")
+                failed_params.append({"b_id": call.id, "b_error": str(e)})
+
+        # One executemany per status bucket, one commit for the batch -
+        # O(1) statements and fsyncs per tick instead of O(rows)
+        if submitted_params:
+            session.connection().execute(self._stmt_mark_submitted, submitted_params)
+        if failed_params:
+            session.connection().execute(self._stmt_mark_failed, failed_params)
+        if pending_calls:
+            session.commit()
+        return bool(pending_calls)
+
+    def _process_submitted_jobs(self, session: Session, call_ids: list[int]) -> bool:
+        """Check submitted jobs (row ids from the combined batch) and update completed ones."""
         # Only for executors that support job checking (RQ, Modal, etc.)
-        if not hasattr(self.executor, 'check_job'):
-            return
+        if self._check_jobs is None or not call_ids:
+            return False
+
+        submitted_calls = session.execute(
+            self._stmt_submitted_detail, {"b_ids": call_ids}
+        ).all()
+        # Release the claim locks before complete_calls touches the same
+        # rows from the service's own session - holding them across that
+        # call self-deadlocks on Postgres/MySQL. Duplicate completions
+        # from workers racing past this point are absorbed by
+        # complete_calls' guarded UPDATE.
+        session.rollback()
+
+        # One batched status check instead of a round-trip per job
+        job_ids = [call.job_id for call in submitted_calls]
+        statuses = self._check_jobs(job_ids) if job_ids else {}
+
+        finished: list[tuple[str, int, object]] = []
+        failed_params = []
+        for call in submitted_calls:
+            try:
+                job_status = statuses.get(
+                    call.job_id, {"status": "error", "error": "Job not found"}
+                )
 
-        with Session(self.service.engine) as session:
-            submitted_calls = (
-                session.query(Call)
-                .filter(Call.status == CallStatus.SUBMITTED, Call.job_id.isnot(None))
-                .limit(50)
-                .all()
-            )
+                if job_status["status"] == "finished":
+                    # Job completed successfully - completed in one batch below
+                    result = job_status["result"]
+                    finished.append((call.execution_id, call.call_id, result))
+                    logger.info(
+                        f"Job {call.job_id[:8]} completed: {call.function_name} = {result}"
+                    )
 
-            for call in submitted_calls:
-                try:
-                    job_status = self.executor.check_job(call.job_id)
-
-                    if job_status["status"] == "finished":
-                        # Job completed successfully
-                        result = job_status["result"]
-                        self.service.complete_call(
-                            call.execution_id,
-                            call.call_id,
-                            result,
-                        )
-                        logger.info(
-                            f"Job {call.job_id[:8]} completed: {call.function_name} = {result}"
-                        )
-
-                    elif job_status["status"] == "failed":
-                        # Job failed
-                        error = job_status.get("error", "Unknown error")
-                        call.status = CallStatus.FAILED
-                        call.error = error
-                        session.commit()
-                        logger.error(f"Job {call.job_id[:8]} failed: {error}")
+                elif job_status["status"] == "failed":
+                    # Job failed - updated in one batch below
+                    error = job_status.get("error", "Unknown error")
+                    failed_params.append({"b_id": call.id, "b_error": error})
+                    logger.error(f"Job {call.job_id[:8]} failed: {error}")
 
-                except Exception as e:
-                    logger.error(f"Error checking job {call.job_id}: {e}")
+            except Exception as e:
+                logger.error(f"Error checking job {call.job_id}: {e}")
+
+        # One executemany + commit for the failed bucket
+        if failed_params:
+            session.connection().execute(self._stmt_mark_failed, failed_params)
+            session.commit()
+
+        # One bulk UPDATE/commit for all completions found this tick
+        if finished:
+            self.service.complete_calls(finished)
+
+        # Jobs still queued/started are not progress for backoff purposes
+        return bool(finished or failed_params)
 
     def _process_waiting(self) -> None:
-        """Check waiting executions and resume if ready."""
-        results = self.service.poll()
+        """Check one page of waiting executions and resume any that are ready."""
+        results = self.service.poll(after_id=self._poll_cursor, limit=self.batch_size)
+        if len(results) < self.batch_size:
+            # Short page: the sweep reached the end - restart from the top
+            self._poll_cursor = None
+        else:
+            self._poll_cursor = results[-1]["execution_id"]
 
         for result in results:
             if result["status"] == ExecutionStatus.COMPLETED.value:
@@ -165,14 +445,36 @@ class Worker:
                     f"Execution {exec_id[:8]} completed with output: {result['output']}"
                 )
 
+    def drain(self, max_iterations: int | None = None) -> None:
+        """
+        Process iterations until no active executions remain, then return.
+
+        One-shot form of run(until_complete=True) without the waiting in
+        between - callers that just created work (tests, scripts) drain it
+        in a single call instead of guessing at a number of run(once=True)
+        loops, and every iteration reuses the worker's precompiled
+        statements and pooled connection.
+
+        Args:
+            max_iterations: Optional bound for workloads that may never
+                finish (e.g. calls stuck on a dead executor).
+        """
+        iterations = 0
+        while self._has_active_executions():
+            if max_iterations is not None and iterations >= max_iterations:
+                break
+            self._process_one_iteration()
+            iterations += 1
+
     def stop(self) -> None:
         """Stop the worker gracefully."""
         logger.info("Worker stop requested")
         self._stop_event.set()
+        self._wake.set()
 
     def _has_active_executions(self) -> bool:
         """Check if there are any active (scheduled or waiting) executions."""
-        with Session(self.service.engine) as session:
+        with self._session_factory() as session:
             active = (
                 session.query(Execution)
                 .filter(
@@ -3,6 +3,8 @@
 Run: uv sync --extra api && uv run python examples/with_webhook.py
 """
 
+import asyncio
+import secrets
 import time
 import threading
 import httpx
@@ -17,28 +19,45 @@ def add(a, b):
 
 
 class WebhookExecutor(Executor):
-    """Simulates event-driven executor (Lambda, Modal) that pushes results via webhook."""
+    """Simulates event-driven executor (Lambda, Modal) that pushes results via webhook.
 
-    def __init__(self, webhook_url: str):
+    Calls run as asyncio tasks on one background event loop with a single
+    shared httpx.AsyncClient, so in-flight calls cost a coroutine instead
+    of an OS thread and callbacks reuse pooled connections instead of a
+    TCP handshake per POST.
+    """
+
+    def __init__(self, webhook_url: str, max_connections: int = 100):
         self.webhook_url = webhook_url
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_connections)
+        )
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+
+    def submit_call(
+        self,
+        function_name: str,
+        args: list,
+        kwargs: dict | None = None,
+        execution_id: str | None = None,
+        call_id: int | None = None,
+    ) -> str:
+        job_id = secrets.token_hex(16)
+        asyncio.run_coroutine_threadsafe(
+            self._execute_and_callback(job_id, function_name, args, kwargs), self._loop
+        )
+        return job_id
 
-    def submit_call(self, function_name: str, args: list) -> str:
-        import uuid
+    async def _execute_and_callback(self, job_id, function_name, args, kwargs):
         from durable_monty.functions import execute_function
 
-        job_id = str(uuid.uuid4())
-
-        def execute_and_callback():
-            time.sleep(0.1)
-            result = execute_function(function_name, args)
-            with httpx.Client() as client:
-                client.post(
-                    f"{self.webhook_url}/webhook/complete",
-                    json={"job_id": job_id, "result": result, "status": "finished"}
-                )
-
-        threading.Thread(target=execute_and_callback).start()
-        return job_id
+        await asyncio.sleep(0.1)  # Simulate remote execution latency
+        result = execute_function(function_name, args, kwargs)
+        await self.client.post(
+            f"{self.webhook_url}/webhook/complete",
+            json={"job_id": job_id, "result": result, "status": "finished"}
+        )
 
     def check_job(self, job_id: str) -> dict:
         return {"status": "submitted"}
@@ -0,0 +1,22 @@
+"""Shared fixtures for the test suite."""
+
+import pytest
+from sqlalchemy import delete
+
+from durable_monty import OrchestratorService, init_db
+from durable_monty.models import Call, Execution
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """One in-memory engine for the whole session - DDL and PRAGMA setup run once."""
+    return init_db("sqlite:///:memory:")
+
+
+@pytest.fixture
+def service(engine):
+    """A fresh service on the shared engine; rows are wiped after each test."""
+    yield OrchestratorService(engine)
+    with engine.begin() as conn:
+        conn.execute(delete(Call))
+        conn.execute(delete(Execution))
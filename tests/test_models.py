@@ -38,3 +38,11 @@ def test_database_models():
 
     call_result = session.query(Call).first()
     assert from_json(call_result.args) == [1, 2]
+
+
+def test_init_db_sqlite_pragmas(tmp_path):
+    """Test file-backed SQLite engines come up in WAL mode."""
+    engine = init_db(f"sqlite:///{tmp_path}/pragmas.db")
+    with engine.connect() as conn:
+        journal_mode = conn.exec_driver_sql("PRAGMA journal_mode").scalar()
+    assert journal_mode == "wal"
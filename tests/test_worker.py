@@ -1,13 +1,13 @@
 """Test worker integration."""
 
-from durable_monty import init_db, OrchestratorService, Worker, LocalExecutor
+from durable_monty import init_db, OrchestratorService, Worker, AsyncWorker, LocalExecutor
 
 
 def add(a, b):
     return a + b
 
 
-def test_worker_integration():
+def test_worker_integration(service):
     """Test Worker processes execution end-to-end."""
     code = """
 from asyncio import gather
@@ -15,22 +15,20 @@ results = await gather(add(1, 2), add(3, 4))
 sum(results)
 """
 
-    service = OrchestratorService(init_db("sqlite:///:memory:"))
     executor = LocalExecutor()
     worker = Worker(service, executor)
 
     exec_id = service.start_execution(code, [add])
 
     # Run worker iterations until complete
-    for _ in range(10):
-        worker.run(once=True)
+    worker.drain()
 
     result = service.poll(exec_id)
     assert result['status'] == 'completed'
     assert result['output'] == 10
 
 
-def test_worker_run_until_complete():
+def test_worker_run_until_complete(service):
     """Test worker.run(until_complete=True) processes all executions and stops."""
     code = """
 from asyncio import gather
@@ -38,7 +36,6 @@ results = await gather(add(1, 2), add(3, 4))
 sum(results)
 """
 
-    service = OrchestratorService(init_db("sqlite:///:memory:"))
     worker = Worker(service, LocalExecutor())
 
     # Create multiple executions
@@ -56,7 +53,7 @@ sum(results)
         assert result == 10
 
 
-def test_worker_stop_with_threading():
+def test_worker_stop_with_threading(service):
     """Test that worker can be stopped cleanly and responsively when running in a thread."""
     import threading
     import time
@@ -67,34 +64,37 @@ results = await gather(add(1, 2), add(3, 4))
 sum(results)
 """
 
-    service = OrchestratorService(init_db("sqlite:///:memory:"))
     # Use a longer poll interval to verify stop is responsive
     worker = Worker(service, LocalExecutor(), poll_interval=10.0)
+    processed = threading.Event()
+    worker.on_processed = lambda worked: processed.set() if worked else None
 
-    # Create some executions
-    for _ in range(3):
-        service.start_execution(code, [add])
+    # Create some executions in one batch (one INSERT, one commit)
+    exec_ids = service.start_executions(code, [add], count=3)
 
     # Start worker in a thread
     worker_thread = threading.Thread(target=worker.run)
     worker_thread.start()
 
-    # Let it process for a bit
-    time.sleep(0.2)
+    # Deterministic: block on actual completions instead of a fixed sleep
+    for exec_id in exec_ids:
+        service.wait_for_completion(exec_id, timeout=5.0)
+    assert processed.wait(timeout=1.0), "on_processed should fire for a productive iteration"
 
     # Stop the worker
     stop_time = time.time()
     worker.stop()
 
-    # Thread should stop quickly (much less than poll_interval)
+    # stop() sets the wake event, so the worker returns from its wait
+    # immediately instead of sleeping out poll_interval
     worker_thread.join(timeout=2.0)
     elapsed = time.time() - stop_time
 
     assert not worker_thread.is_alive(), "Worker thread should have stopped"
-    assert elapsed < 2.0, f"Worker took {elapsed}s to stop (should be responsive, not wait for full poll_interval)"
+    assert elapsed < 0.5, f"Worker took {elapsed}s to stop (should be responsive, not wait for full poll_interval)"
 
 
-def test_poll_only_returns_waiting_executions():
+def test_poll_only_returns_waiting_executions(service):
     """Test that poll() without arguments only returns waiting executions, not completed ones."""
     code = """
 from asyncio import gather
@@ -102,13 +102,10 @@ results = await gather(add(1, 2), add(3, 4))
 sum(results)
 """
 
-    service = OrchestratorService(init_db("sqlite:///:memory:"))
-
     # Create first execution and complete it
     exec_id_1 = service.start_execution(code, [add])
     worker = Worker(service, LocalExecutor())
-    for _ in range(10):
-        worker.run(once=True)
+    worker.drain()
 
     # Verify exec_id_1 is completed
     result1 = service.poll(exec_id_1)
@@ -137,3 +134,88 @@ sum(results)
     # The scheduled execution (exec_id_3) should NOT be in the results
     # (poll only returns "waiting", not "scheduled")
     assert exec_id_3 not in polled_exec_ids, "Scheduled execution should not be returned by poll()"
+
+
+def test_worker_phase_workers(tmp_path):
+    """Test the worker with concurrent tick phases."""
+    code = """
+from asyncio import gather
+results = await gather(add(1, 2), add(3, 4))
+sum(results)
+"""
+
+    # File-backed DB: concurrent phases run in threads, and separate
+    # in-memory SQLite connections would not share data
+    service = OrchestratorService(init_db(f"sqlite:///{tmp_path}/test.db"))
+    worker = Worker(service, LocalExecutor(), poll_interval=0.05, phase_workers=4)
+
+    exec_id = service.start_execution(code, [add])
+
+    worker.run(until_complete=True)
+
+    assert service.get_result(exec_id) == 10
+
+
+def test_async_worker_until_complete(tmp_path):
+    """Test AsyncWorker processes executions concurrently until complete."""
+    import asyncio
+
+    code = """
+from asyncio import gather
+results = await gather(add(1, 2), add(3, 4))
+sum(results)
+"""
+
+    # File-backed DB: AsyncWorker phases run in threads, and separate
+    # in-memory SQLite connections would not share data
+    service = OrchestratorService(init_db(f"sqlite:///{tmp_path}/test.db"))
+    worker = AsyncWorker(service, LocalExecutor(), poll_interval=0.05)
+
+    exec_id = service.start_execution(code, [add])
+
+    asyncio.run(worker.run_async(until_complete=True))
+
+    assert service.get_result(exec_id) == 10
+
+
+def test_wait_for_completion(service):
+    """Test blocking on service.wait_for_completion instead of polling."""
+    import threading
+
+    code = """
+from asyncio import gather
+results = await gather(add(1, 2), add(3, 4))
+sum(results)
+"""
+
+    worker = Worker(service, LocalExecutor(), poll_interval=0.05)
+
+    exec_id = service.start_execution(code, [add])
+
+    worker_thread = threading.Thread(target=worker.run)
+    worker_thread.start()
+    try:
+        result = service.wait_for_completion(exec_id, timeout=5.0)
+    finally:
+        worker.stop()
+        worker_thread.join(timeout=2.0)
+
+    assert result['status'] == 'completed'
+    assert result['output'] == 10
+
+
+def test_local_executor_thread_pool(service):
+    """Test LocalExecutor with max_workers runs calls off-thread to completion."""
+    code = """
+from asyncio import gather
+results = await gather(add(1, 2), add(3, 4))
+sum(results)
+"""
+
+    worker = Worker(service, LocalExecutor(max_workers=4), poll_interval=0.05)
+
+    exec_id = service.start_execution(code, [add])
+
+    worker.run(until_complete=True)
+
+    assert service.get_result(exec_id) == 10